@@ -25,7 +25,7 @@ class Config:
     
     # File extensions
     SIGNATURE_FILE_EXTENSION = ".sig"
-    HASH_FILE_EXTENSION = ".sha256"
+    COMPRESSED_FILE_EXTENSION = ".zst"
     
     # Key file names
     PRIVATE_KEY_FILENAME = "private_key.pem"
@@ -35,15 +35,32 @@ class Config:
     S3_BUCKET_NAME = "audit-trail-archive"
     S3_PREFIX = "audit-logs"
     S3_STORAGE_CLASS = "GLACIER"
+    S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024  # Use multipart uploads above 8 MiB
+    S3_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024  # Size of each multipart part
+    S3_MAX_CONCURRENCY = 8  # Parallel parts per multipart upload
+    S3_MAX_POOL_CONNECTIONS = 32
+    S3_MAX_ATTEMPTS = 10
+    S3_UPLOAD_WORKERS = 16  # Files uploaded concurrently by StorageProcessor.upload_files
     
     # Logging settings
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     LOG_LEVEL = "INFO"
     LOG_FILENAME_FORMAT = "api_log_%Y-%m-%d.log"
+    LOG_BUFFER_SIZE = 256 * 1024  # Bytes buffered before the audit log is written out
+    
+    # Compression settings (snapshots are zstd-compressed before hashing and signing)
+    COMPRESS_LOGS = True
+    COMPRESSION_LEVEL = 3
     
     # Cryptographic settings
-    RSA_KEY_SIZE = 2048
+    SIGNATURE_ALGORITHM = "Ed25519"
+    # Digest signed and stored alongside each log. Any fixed-length hashlib algorithm
+    # works (not shake_*); "sha256" is FIPS-approved, "blake2b" is faster on CPUs without
+    # SHA extensions but is opt-in. The hash file extension is the algorithm name, and
+    # each signature records the algorithm it was made with, so changing this setting
+    # does not invalidate existing signatures
     HASH_ALGORITHM = "sha256"
+    HASH_CHUNK_SIZE = 1024 * 1024  # 1 MiB reads when hashing files
     
     @classmethod
     def get_private_key_path(cls):
@@ -60,3 +77,15 @@ class Config:
         """Get the log path for a specific date."""
         filename = date.strftime(cls.LOG_FILENAME_FORMAT)
         return cls.LOG_DIR / filename
+    
+    @classmethod
+    def get_signature_path(cls, file_path):
+        """Get the path of the signature file for a file."""
+        file_path = Path(file_path)
+        return file_path.with_name(file_path.name + cls.SIGNATURE_FILE_EXTENSION)
+    
+    @classmethod
+    def get_hash_path(cls, file_path):
+        """Get the path of the hash file for a file (named after the hash algorithm)."""
+        file_path = Path(file_path)
+        return file_path.with_name(f"{file_path.name}.{cls.HASH_ALGORITHM}")
@@ -5,43 +5,201 @@ Log collection functionality for the audit trail integrity system.
 This module handles the collection and formatting of audit logs for API events.
 """
 
+import re
+import os
 import json
+import time
 import uuid
+import random
 import logging
+import weakref
 import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+import orjson
+
 from config import Config
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format=Config.LOG_FORMAT
-)
+# Logging output is configured once, by the entry point (main.py)
 logger = logging.getLogger('audit_trail')
 
+# Keys containing any of these substrings (case-insensitive) are redacted
+SENSITIVE_FIELDS = ["password", "token", "api_key", "secret", "credential"]
+_SENSITIVE_KEY_RE = re.compile("|".join(map(re.escape, SENSITIVE_FIELDS)), re.IGNORECASE)
+
+# State for time-ordered event IDs: last millisecond used and a counter within it
+_last_event_ms = 0
+_event_seq = 0
+
+# Private PRNG for the random part of event IDs, seeded from the OS so that
+# application calls to random.seed() cannot make IDs predictable
+_event_rng = random.Random(os.urandom(16))
+
+
+def _reseed_event_rng() -> None:
+    """Give a forked child its own event ID randomness instead of a copy of the parent's."""
+    _event_rng.seed(os.urandom(16))
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_event_rng)
+
+
+def _new_event_id() -> str:
+    """Generate a time-ordered UUIDv7 (RFC 9562) string for an audit event.
+    
+    Uses the millisecond clock plus a per-millisecond counter, so IDs sort
+    by creation time, and draws the random tail from a private PRNG seeded
+    once from os.urandom instead of calling os.urandom for every event.
+    """
+    global _last_event_ms, _event_seq
+    
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms > _last_event_ms:
+        _last_event_ms, _event_seq = now_ms, 0
+    else:
+        _event_seq += 1
+        if _event_seq > 0xFFF:
+            _last_event_ms, _event_seq = _last_event_ms + 1, 0
+            
+    value = (
+        (_last_event_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | _event_seq << 64
+        | 0b10 << 62
+        | _event_rng.getrandbits(62)
+    )
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent event timestamp
+_timestamp_cache = (None, "")
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time as an ISO 8601 string with microseconds.
+    
+    The date/time prefix is formatted only when the second changes; within
+    a second just the microsecond suffix is appended.
+    """
+    global _timestamp_cache
+    
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _timestamp_cache
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_cache = (seconds, prefix)
+        
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
+
+
+# Live BufferedFileHandlers, so their buffers can be managed around fork()
+_buffered_handlers = weakref.WeakSet()
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes instead of flushing after every record.
+    
+    Records are still formatted as usual but accumulate in a large stream
+    buffer; the buffer is written out when it fills, when an ERROR or worse
+    is logged, and when the handler is flushed or closed.
+    """
+    
+    def __init__(self, filename: Path, buffer_size: int = Config.LOG_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self.flush_each_record = False
+        # orjson emits raw UTF-8, so the file must not depend on the locale's encoding
+        super().__init__(filename, encoding="utf-8")
+        _buffered_handlers.add(self)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if self.flush_each_record or record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _flush_buffered_handlers() -> None:
+    """Write out pending records so a forked child does not inherit (and replay) them."""
+    for handler in list(_buffered_handlers):
+        handler.flush()
+
+
+def _unbuffer_handlers_in_child() -> None:
+    """Make handlers in a forked child flush every record.
+    
+    Pool workers exit without flushing their stdio buffers, so anything they
+    buffered would otherwise be lost.
+    """
+    for handler in list(_buffered_handlers):
+        handler.flush_each_record = True
+
+
+# Worker pools (sign_many / verify_many) fork this process
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_flush_buffered_handlers, after_in_child=_unbuffer_handlers_in_child)
+
+
 class AuditLogger:
     """Handles the collection and formatting of audit logs."""
     
     def __init__(self):
         """Initialize the audit logger."""
+        self.log_date = datetime.date.today()
         self.log_path = self._get_log_path()
         self._setup_file_handler()
     
     def _get_log_path(self) -> Path:
         """Get the path to the log file for the current date."""
-        today = datetime.date.today()
-        return Config.get_log_path_for_date(today)
+        return Config.get_log_path_for_date(self.log_date)
     
     def _setup_file_handler(self) -> None:
         """Set up the file handler for logging."""
-        file_handler = logging.FileHandler(self.log_path)
+        file_handler = BufferedFileHandler(self.log_path)
         file_handler.setLevel(getattr(logging, Config.LOG_LEVEL))
         file_handler.setFormatter(logging.Formatter(Config.LOG_FORMAT))
         
-        # Add the file handler to the logger
+        # Add the file handler to the logger; the logger's own level must let audit
+        # events through even when the application never configures logging
+        logger.setLevel(getattr(logging, Config.LOG_LEVEL))
         logger.addHandler(file_handler)
+        self._file_handler = file_handler
+    
+    def close(self) -> None:
+        """Detach and close this logger's file handler."""
+        logger.removeHandler(self._file_handler)
+        self._file_handler.close()
+    
+    def rotate(self, rotated_path: Path) -> None:
+        """Move the current log file to rotated_path and start a fresh one.
+        
+        Args:
+            rotated_path: Path the current log file is renamed to
+        """
+        # A logger already closed (e.g. replaced by get_audit_logger on a new day) must not reattach
+        reopen = self._file_handler in logger.handlers
+        
+        # Close every handler writing to the log so nothing appends to the rotated file
+        for handler in logger.handlers[:]:
+            if isinstance(handler, logging.FileHandler) and Path(handler.baseFilename) == self.log_path:
+                logger.removeHandler(handler)
+                handler.close()
+                
+        os.replace(self.log_path, rotated_path)
+        if reopen:
+            self._setup_file_handler()
     
     def log_event(self, event_type: str, details: Dict[str, Any], user_id: str) -> str:
         """Log an event with the specified details.
@@ -54,8 +212,8 @@ class AuditLogger:
         Returns:
             The ID of the logged event
         """
-        event_id = str(uuid.uuid4())
-        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        event_id = _new_event_id()
+        timestamp = _utc_timestamp()
         
         log_entry = {
             "event_id": event_id,
@@ -65,8 +223,12 @@ class AuditLogger:
             "user_id": user_id
         }
         
-        # Log the event
-        logger.info(f"AUDIT: {json.dumps(log_entry)}")
+        # Log the event; orjson rejects some payloads json accepts (e.g. ints beyond 64 bits)
+        try:
+            serialized = orjson.dumps(log_entry, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            serialized = json.dumps(log_entry, separators=(",", ":"))
+        logger.info(f"AUDIT: {serialized}")
         
         return event_id
     
@@ -83,19 +245,45 @@ class AuditLogger:
             return data
             
         sanitized = {}
-        sensitive_fields = ["password", "token", "api_key", "secret", "credential"]
         
-        for key, value in data.items():
-            if isinstance(value, dict):
-                sanitized[key] = self._sanitize_data(value)
-            elif any(sensitive in key.lower() for sensitive in sensitive_fields):
-                sanitized[key] = "[REDACTED]"
-            else:
-                sanitized[key] = value
-                
+        # Walk nested dicts with an explicit stack of (source, copy) pairs instead of recursing
+        stack = [(data, sanitized)]
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    target[key] = {}
+                    stack.append((value, target[key]))
+                elif _SENSITIVE_KEY_RE.search(key):
+                    target[key] = "[REDACTED]"
+                else:
+                    target[key] = value
+                    
         return sanitized
 
 
+_audit_logger: Optional[AuditLogger] = None
+
+
+def get_audit_logger() -> AuditLogger:
+    """Get the shared AuditLogger for today's log file.
+    
+    The instance (and its file handler) is created once per day and reused
+    by every caller, instead of attaching a new handler per AuditLogger().
+    
+    Returns:
+        The AuditLogger writing to today's log
+    """
+    global _audit_logger
+    
+    if _audit_logger is None or _audit_logger.log_date != datetime.date.today():
+        if _audit_logger is not None:
+            _audit_logger.close()
+        _audit_logger = AuditLogger()
+        
+    return _audit_logger
+
+
 def generate_sample_logs(count: int = 10) -> tuple[Path, bool, Any]:
     """Generate sample logs for demonstration purposes.
     
@@ -106,8 +294,6 @@ def generate_sample_logs(count: int = 10) -> tuple[Path, bool, Any]:
         Tuple containing (log_path, success_flag, processor_instance)
     """
     from log_signer import AuditTrailProcessor
-    import time
-    import uuid
     
     processor = AuditTrailProcessor()
     
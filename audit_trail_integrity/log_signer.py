@@ -6,40 +6,77 @@ This module handles the cryptographic signing and verification of log files
 to ensure their integrity and authenticity.
 """
 
+import json
+import hashlib
 import logging
-import shutil
+import mmap
+import os
+import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
 from cryptography.exceptions import InvalidSignature
+import zstandard
 
 from config import Config
-from log_collector import AuditLogger
+from log_collector import get_audit_logger
+from s3_uploader import StorageProcessor
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format=Config.LOG_FORMAT
-)
+# Size of a bare Ed25519 signature, as written before signatures recorded their hash algorithm
+_LEGACY_SIGNATURE_SIZE = 64
+
+# Logging output is configured once, by the entry point (main.py)
 logger = logging.getLogger('audit_trail')
 
+
+def _write_durably(path: Path, data: bytes) -> None:
+    """Atomically replace a file's contents and flush them to disk.
+    
+    The data is written to a temporary sibling file, fsynced, and renamed into
+    place, so a crash never leaves a partial or unsynced hash or signature.
+    
+    Args:
+        path: Destination path
+        data: Bytes to write
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+    
+    # Persist the rename itself
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
 class CryptographicProcessor:
     """Handles cryptographic operations for log integrity."""
     
+    # Parsed keys are cached and only reloaded when the PEM file's mtime changes
+    _private_key = None
+    _private_key_mtime = None
+    _public_key = None
+    _public_key_mtime = None
+    
     @classmethod
     def generate_keys(cls) -> Tuple[bool, str]:
-        """Generate RSA key pair for signing and verification.
+        """Generate Ed25519 key pair for signing and verification.
         
         Returns:
             Tuple containing (success_flag, message)
         """
         try:
-            private_key = rsa.generate_private_key(
-                public_exponent=65537,
-                key_size=Config.RSA_KEY_SIZE
-            )
+            private_key = Ed25519PrivateKey.generate()
             
             # Get the public key
             public_key = private_key.public_key()
@@ -64,41 +101,76 @@ class CryptographicProcessor:
             with open(Config.get_public_key_path(), 'wb') as f:
                 f.write(public_pem)
                 
+            # Drop any cached keys so the new pair is picked up
+            cls._private_key = cls._public_key = None
+            
             return True, "Keys generated successfully."
         except Exception as e:
             return False, f"Error generating keys: {e}"
     
     @classmethod
-    def calculate_sha256(cls, file_path: Union[str, Path]) -> Optional[str]:
-        """Calculate SHA-256 hash of a file.
+    def calculate_digest(cls, file_path: Union[str, Path], algorithm: Optional[str] = None) -> Optional[bytes]:
+        """Calculate the raw digest of a file.
         
         Args:
             file_path: Path to the file
+            algorithm: hashlib algorithm name (default: Config.HASH_ALGORITHM)
             
         Returns:
-            Hexadecimal string representation of the hash, or None if error
+            Raw digest bytes, or None if error
         """
         try:
-            import hashlib
-            
-            if isinstance(file_path, str):
-                file_path = Path(file_path)
-                
-            if not file_path.exists():
-                logger.error(f"File not found for hashing: {file_path}")
-                return None
-                
-            # Calculate hash
-            sha256_hash = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-                    
-            return sha256_hash.hexdigest()
+            # Unbuffered: every read below is already large, so io-layer buffering only adds a copy
+            with open(file_path, 'rb', buffering=0) as f:
+                return cls._digest_open_file(f, algorithm or Config.HASH_ALGORITHM)
+        except FileNotFoundError:
+            logger.error(f"File not found for hashing: {file_path}")
+            return None
         except Exception as e:
             logger.error(f"Error calculating hash: {e}")
             return None
     
+    @staticmethod
+    def _digest_open_file(f, algorithm: str) -> bytes:
+        """Hash an open, unbuffered binary file from its current position.
+        
+        Args:
+            f: File object opened with buffering=0
+            algorithm: hashlib algorithm name
+            
+        Returns:
+            Raw digest bytes
+        """
+        # Hash a read-only mapping of the file in one C call, straight from the page cache
+        if os.fstat(f.fileno()).st_size > 0:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return hashlib.new(algorithm, mapped).digest()
+            except (ValueError, OSError):
+                pass  # Not mappable; fall back to reading
+                
+        # file_digest runs the read/update loop with a reused buffer
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, algorithm).digest()
+            
+        file_hash = hashlib.new(algorithm)
+        for byte_block in iter(lambda: f.read(Config.HASH_CHUNK_SIZE), b""):
+            file_hash.update(byte_block)
+        return file_hash.digest()
+    
+    @classmethod
+    def calculate_sha256(cls, file_path: Union[str, Path]) -> Optional[str]:
+        """Calculate SHA-256 hash of a file.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Hexadecimal string representation of the hash, or None if error
+        """
+        digest = cls.calculate_digest(file_path, "sha256")
+        return digest.hex() if digest else None
+    
     @classmethod
     def save_hash(cls, hash_value: str, hash_path: Path) -> bool:
         """Save a hash value to a file.
@@ -111,21 +183,21 @@ class CryptographicProcessor:
             True if successful, False otherwise
         """
         try:
-            with open(hash_path, 'w') as f:
-                f.write(hash_value)
+            _write_durably(Path(hash_path), hash_value.encode())
                 
-            logger.info(f"SHA-256 hash saved to: {hash_path}")
+            logger.info("%s hash saved to: %s", Config.HASH_ALGORITHM, hash_path)
             return True
         except Exception as e:
             logger.error(f"Error saving hash: {e}")
             return False
     
     @classmethod
-    def sign_file(cls, file_path: Union[str, Path]) -> Optional[Path]:
+    def sign_file(cls, file_path: Union[str, Path], *, verify_after_sign: bool = False) -> Optional[Path]:
         """Sign a file using the private key.
         
         Args:
             file_path: Path to the file to sign
+            verify_after_sign: If True, verify the new signature immediately as a sanity check
             
         Returns:
             Path to the signature file if successful, None otherwise
@@ -135,46 +207,147 @@ class CryptographicProcessor:
             if isinstance(file_path, str):
                 file_path = Path(file_path)
                 
-            if not file_path.exists():
-                logger.error(f"File not found: {file_path}")
+            # Stream the file through the hash rather than reading it into memory
+            algorithm = Config.HASH_ALGORITHM
+            digest = cls.calculate_digest(file_path, algorithm)
+            if not digest:
                 return None
                 
-            # Read the file content
-            with open(file_path, 'rb') as f:
-                file_content = f.read()
+            # Sign the digest of the file content
+            signature_path = Config.get_signature_path(file_path)
+            if not cls.sign_digest(digest, signature_path, algorithm):
+                return None
+                
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("File size: %d bytes", file_path.stat().st_size)
+            
+            # Optional immediate verification to confirm the signature works
+            if verify_after_sign:
+                if cls.verify_file(file_path, signature_path):
+                    logger.info("Immediate verification after signing: SUCCESS")
+                else:
+                    logger.warning("Immediate verification after signing: FAILED - Check cryptographic implementation")
+                    
+            return signature_path
+        except Exception as e:
+            logger.error(f"Error signing file: {e}")
+            return None
+            
+    @classmethod
+    def sign_digest(cls, digest: bytes, signature_path: Union[str, Path], algorithm: Optional[str] = None) -> Optional[Path]:
+        """Sign a precomputed digest and save the signature.
+        
+        The hash algorithm name is signed together with the digest and written
+        in front of the signature ("<algorithm>:<signature>"), so verification
+        does not depend on the current Config.HASH_ALGORITHM.
+        
+        Args:
+            digest: Raw digest of the data being signed
+            signature_path: Path to save the signature to
+            algorithm: hashlib algorithm that produced digest (default: Config.HASH_ALGORITHM)
+            
+        Returns:
+            Path to the signature file if successful, None otherwise
+        """
+        try:
+            if isinstance(signature_path, str):
+                signature_path = Path(signature_path)
                 
-            # Sign the file content
             private_key = cls._load_private_key()
             if not private_key:
                 return None
                 
-            # Sign with PKCS1v15 padding
-            signature = private_key.sign(
-                file_content,
-                padding.PKCS1v15(),
-                hashes.SHA256()
-            )
-            
-            # Save the signature to a file
-            signature_path = Path(f"{file_path}{Config.SIGNATURE_FILE_EXTENSION}")
-            with open(signature_path, 'wb') as f:
-                f.write(signature)
-                
-            logger.info(f"File signed successfully. Signature saved to: {signature_path}")
-            logger.info(f"File size: {len(file_content)} bytes")
-            logger.info(f"Signature size: {len(signature)} bytes")
-            
-            # Immediate verification to confirm the signature works
-            verification_result = cls.verify_file(file_path, signature_path)
-            if verification_result:
-                logger.info(f"Immediate verification after signing: SUCCESS")
-            else:
-                logger.warning(f"Immediate verification after signing: FAILED - Check cryptographic implementation")
+            algorithm = (algorithm or Config.HASH_ALGORITHM).encode("ascii")
+            signature = private_key.sign(algorithm + b":" + digest)
+            _write_durably(signature_path, algorithm + b":" + signature)
                 
+            logger.info("Digest signed successfully. Signature saved to: %s", signature_path)
+            logger.debug("Signature size: %d bytes", len(signature))
             return signature_path
         except Exception as e:
-            logger.error(f"Error signing file: {e}")
+            logger.error(f"Error signing digest: {e}")
             return None
+    
+    @classmethod
+    def verify_digest(cls, digest: bytes, signature: bytes, algorithm: Optional[str]) -> bool:
+        """Verify a signature over a precomputed digest.
+        
+        Args:
+            digest: Raw digest of the signed data
+            signature: Signature bytes to check
+            algorithm: Hash algorithm bound into the signature, or None for a legacy
+                signature over the bare SHA-256 digest
+            
+        Returns:
+            True if the signature is valid, False otherwise
+        """
+        public_key = cls._load_public_key()
+        if not public_key:
+            return False
+            
+        message = digest if algorithm is None else algorithm.encode("ascii") + b":" + digest
+        try:
+            public_key.verify(signature, message)
+            return True
+        except InvalidSignature:
+            return False
+            
+    @staticmethod
+    def parse_signature(data: bytes) -> Tuple[Optional[str], bytes]:
+        """Split signature file contents into the hash algorithm and the signature.
+        
+        Args:
+            data: Contents of a signature file written by sign_digest
+            
+        Returns:
+            Tuple containing (algorithm, signature); algorithm is None for a legacy
+            bare signature, which covers a raw SHA-256 digest
+        """
+        if len(data) == _LEGACY_SIGNATURE_SIZE:
+            return None, data
+        algorithm, _, signature = data.partition(b":")
+        return algorithm.decode("ascii"), signature
+    
+    @classmethod
+    def sign_many(cls, file_paths: List[Union[str, Path]], workers: Optional[int] = None) -> List[Optional[Path]]:
+        """Sign several files in parallel across worker processes.
+        
+        Each worker loads the private key once at startup and then hashes and
+        signs its share of the files.
+        
+        Args:
+            file_paths: Paths to the files to sign
+            workers: Number of worker processes (default: one per CPU, at most one per file)
+            
+        Returns:
+            List of signature paths in the same order as file_paths (None where signing failed)
+        """
+        if not file_paths:
+            return []
+            
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_signing_worker) as executor:
+            return list(executor.map(_sign_in_worker, [str(path) for path in file_paths]))
+            
+    @classmethod
+    def verify_many(cls, pairs: List[Tuple[Union[str, Path], Union[str, Path]]], workers: Optional[int] = None) -> List[bool]:
+        """Verify several files in parallel across worker processes.
+        
+        Args:
+            pairs: (file_path, signature_path) tuples to verify
+            workers: Number of worker processes (default: one per CPU, at most one per pair)
+            
+        Returns:
+            List of verification results in the same order as pairs
+        """
+        if not pairs:
+            return []
+            
+        workers = min(workers or os.cpu_count() or 1, len(pairs))
+        # Batch pairs to cut IPC, but keep ~4 chunks per worker so small inputs still spread out
+        chunksize = max(1, len(pairs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_verifying_worker) as executor:
+            return list(executor.map(_verify_in_worker, [(str(f), str(s)) for f, s in pairs], chunksize=chunksize))
             
     @classmethod
     def verify_file(cls, file_path: Union[str, Path], signature_path: Union[str, Path]) -> bool:
@@ -187,95 +360,218 @@ class CryptographicProcessor:
         Returns:
             True if the signature is valid, False otherwise
         """
+        # Open each file once; existence is checked by the open itself rather than a separate stat
         try:
-            # Ensure paths are Path objects
-            if isinstance(file_path, str):
-                file_path = Path(file_path)
-            if isinstance(signature_path, str):
-                signature_path = Path(signature_path)
-                
-            # Check if files exist
-            if not file_path.exists():
-                logger.error(f"File not found: {file_path}")
-                return False
-            if not signature_path.exists():
+            file_fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}")
+            return False
+        except OSError as e:
+            logger.error(f"Error verifying file: {e}")
+            return False
+            
+        try:
+            try:
+                signature_fd = os.open(signature_path, os.O_RDONLY)
+            except FileNotFoundError:
                 logger.error(f"Signature file not found: {signature_path}")
                 return False
+            try:
+                verified = cls.verify_fd(file_fd, signature_fd)
+            finally:
+                os.close(signature_fd)
+        except Exception as e:
+            logger.error(f"Error verifying file: {e}")
+            return False
+        finally:
+            os.close(file_fd)
+            
+        if verified:
+            logger.info("Signature verified successfully for %s", file_path)
+        else:
+            logger.error("Signature verification FAILED for %s", file_path)
+        return verified
+    
+    @classmethod
+    def verify_fd(cls, file_fd: int, signature_fd: int) -> bool:
+        """Verify a signature given already-open file descriptors.
+        
+        The descriptors are read from the start and left open for the caller to close.
+        
+        Args:
+            file_fd: Read-only descriptor of the file to verify
+            signature_fd: Read-only descriptor of the signature file
+            
+        Returns:
+            True if the signature is valid, False otherwise
+        """
+        # Read the signature first: it names the hash algorithm the file was signed with
+        with open(signature_fd, 'rb', closefd=False) as f:
+            f.seek(0)
+            algorithm, signature = cls.parse_signature(f.read())
+        with open(file_fd, 'rb', buffering=0, closefd=False) as f:
+            f.seek(0)
+            digest = cls._digest_open_file(f, algorithm or "sha256")
+            
+        # Log file sizes for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("File size: %d bytes, signature size: %d bytes", os.fstat(file_fd).st_size, len(signature))
+            
+        # Verify the signature over the digest
+        return cls.verify_digest(digest, signature, algorithm)
+
+    @classmethod
+    def sign_batch(cls, file_paths: List[Union[str, Path]], manifest_path: Union[str, Path]) -> Optional[Path]:
+        """Sign several files with a single signature over a digest manifest.
+        
+        The manifest maps each file path to its SHA-256 hex digest and is
+        written as JSON; only the manifest itself is signed.
+        
+        Args:
+            file_paths: Paths to the files to cover
+            manifest_path: Path to write the manifest to
+            
+        Returns:
+            Path to the manifest signature file if successful, None otherwise
+        """
+        try:
+            if isinstance(manifest_path, str):
+                manifest_path = Path(manifest_path)
                 
-            # Read the file and signature
-            with open(file_path, 'rb') as f:
-                file_content = f.read()
-            with open(signature_path, 'rb') as f:
-                signature = f.read()
+            manifest = {}
+            for file_path in file_paths:
+                hash_value = cls.calculate_sha256(file_path)
+                if not hash_value:
+                    return None
+                manifest[str(file_path)] = hash_value
                 
-            # Log file sizes for debugging
-            logger.info(f"File size: {len(file_content)} bytes")
-            logger.info(f"Signature size: {len(signature)} bytes")
+            manifest_bytes = json.dumps(manifest, indent=2, sort_keys=True).encode()
+            _write_durably(manifest_path, manifest_bytes)
                 
-            # Verify the signature
-            public_key = cls._load_public_key()
-            if not public_key:
-                return False
+            logger.info(f"Manifest of {len(manifest)} files saved to: {manifest_path}")
+            signature_path = Config.get_signature_path(manifest_path)
+            return cls.sign_digest(hashlib.sha256(manifest_bytes).digest(), signature_path, "sha256")
+        except Exception as e:
+            logger.error(f"Error signing batch: {e}")
+            return None
+    
+    @classmethod
+    def verify_batch(cls, manifest_path: Union[str, Path], signature_path: Union[str, Path]) -> bool:
+        """Verify a signed manifest and every file it lists.
+        
+        Args:
+            manifest_path: Path to the manifest written by sign_batch
+            signature_path: Path to the manifest signature file
+            
+        Returns:
+            True if the signature is valid and all file digests match, False otherwise
+        """
+        try:
+            with open(manifest_path, 'rb') as f:
+                manifest_bytes = f.read()
+            with open(signature_path, 'rb') as f:
+                algorithm, signature = cls.parse_signature(f.read())
                 
-            # Verify with PKCS1v15 padding
-            try:
-                public_key.verify(
-                    signature,
-                    file_content,
-                    padding.PKCS1v15(),
-                    hashes.SHA256()
-                )
-                logger.info(f"Signature verified successfully for {file_path}")
-                return True
-            except InvalidSignature as e:
-                logger.error(f"Signature verification FAILED: {e} for {file_path}")
+            manifest_digest = hashlib.new(algorithm or "sha256", manifest_bytes).digest()
+            if not cls.verify_digest(manifest_digest, signature, algorithm):
+                logger.error(f"Manifest signature verification FAILED for {manifest_path}")
                 return False
+                
+            for file_path, expected in json.loads(manifest_bytes).items():
+                if cls.calculate_sha256(file_path) != expected:
+                    logger.error(f"Digest mismatch for {file_path} listed in {manifest_path}")
+                    return False
+                    
+            logger.info(f"Manifest verified successfully for {manifest_path}")
+            return True
         except Exception as e:
-            logger.error(f"Error verifying file: {e}")
+            logger.error(f"Error verifying batch: {e}")
             return False
 
-    @staticmethod
-    def _load_private_key() -> Optional[Any]:
-        """Load the private key from the file."""
+    @classmethod
+    def _load_private_key(cls) -> Optional[Ed25519PrivateKey]:
+        """Load the private key from the file, reusing the cached key if unchanged."""
         private_key_path = Config.get_private_key_path()
-        if not private_key_path.exists():
+        try:
+            mtime = os.stat(private_key_path).st_mtime_ns
+        except FileNotFoundError:
             logger.error(f"Private key not found at {private_key_path}")
             return None
             
+        if cls._private_key is not None and cls._private_key_mtime == mtime:
+            return cls._private_key
+            
         try:
             with open(private_key_path, "rb") as key_file:
                 private_key = serialization.load_pem_private_key(
                     key_file.read(),
                     password=None
                 )
+            if not isinstance(private_key, Ed25519PrivateKey):
+                logger.error(f"Private key at {private_key_path} is not an Ed25519 key; regenerate keys")
+                return None
+            cls._private_key, cls._private_key_mtime = private_key, mtime
             return private_key
         except Exception as e:
             logger.error(f"Error loading private key: {e}")
             return None
 
-    @staticmethod
-    def _load_public_key() -> Optional[Any]:
-        """Load the public key from the file."""
+    @classmethod
+    def _load_public_key(cls) -> Optional[Ed25519PublicKey]:
+        """Load the public key from the file, reusing the cached key if unchanged."""
         public_key_path = Config.get_public_key_path()
-        if not public_key_path.exists():
+        try:
+            mtime = os.stat(public_key_path).st_mtime_ns
+        except FileNotFoundError:
             logger.error(f"Public key not found at {public_key_path}")
             return None
             
+        if cls._public_key is not None and cls._public_key_mtime == mtime:
+            return cls._public_key
+            
         try:
             with open(public_key_path, "rb") as key_file:
                 public_key = serialization.load_pem_public_key(key_file.read())
+            if not isinstance(public_key, Ed25519PublicKey):
+                logger.error(f"Public key at {public_key_path} is not an Ed25519 key; regenerate keys")
+                return None
+            cls._public_key, cls._public_key_mtime = public_key, mtime
             return public_key
         except Exception as e:
             logger.error(f"Error loading public key: {e}")
             return None
 
 
+def _init_signing_worker() -> None:
+    """Load the private key into a sign_many worker process's key cache."""
+    CryptographicProcessor._load_private_key()
+
+
+def _sign_in_worker(file_path: str) -> Optional[Path]:
+    """Hash and sign one file inside a sign_many worker process."""
+    algorithm = Config.HASH_ALGORITHM
+    digest = CryptographicProcessor.calculate_digest(file_path, algorithm)
+    if not digest:
+        return None
+    return CryptographicProcessor.sign_digest(digest, Config.get_signature_path(file_path), algorithm)
+
+
+def _init_verifying_worker() -> None:
+    """Load the public key into a verify_many worker process's key cache."""
+    CryptographicProcessor._load_public_key()
+
+
+def _verify_in_worker(pair: Tuple[str, str]) -> bool:
+    """Verify one (file_path, signature_path) pair inside a verify_many worker process."""
+    return CryptographicProcessor.verify_file(*pair)
+
+
 class AuditTrailProcessor:
     """Processes audit trail logs for signing and verification."""
     
     def __init__(self):
         """Initialize the audit trail processor."""
-        self.audit_logger = AuditLogger()
+        self.audit_logger = get_audit_logger()
         self.crypto = CryptographicProcessor
         
     def log_api_event(self, api_endpoint: str, user_id: str, request_data: Dict, response_data: Dict, status_code: int):
@@ -307,32 +603,51 @@ class AuditTrailProcessor:
         """
         log_path = self.audit_logger.log_path
         
-        # Ensure all log data is flushed to disk
-        for handler in logging.getLogger().handlers:
-            if isinstance(handler, logging.FileHandler):
-                handler.flush()
-        
-        # Create a snapshot copy of the log file for signing
-        snapshot_log_path = Path(f"{log_path}.snapshot")
-        shutil.copy2(log_path, snapshot_log_path)
+        # Rotate the log file into a time-stamped snapshot for signing; a rename
+        # copies no data and later log lines go to a fresh file, not the snapshot
+        timestamp = datetime.datetime.now().strftime("%H%M%S%f")
+        snapshot_log_path = log_path.with_name(f"{log_path.name}.{timestamp}.snapshot")
+        self.audit_logger.rotate(snapshot_log_path)
         
         logger.info(f"Created snapshot of log file for signing: {snapshot_log_path}")
         
-        # 1. Calculate hash of the snapshot
-        hash_value = self.crypto.calculate_sha256(snapshot_log_path)
-        if not hash_value:
+        # 1. Calculate hash of the snapshot once; it feeds both the hash file and the signature.
+        # When compressing, the compressed bytes are hashed as they are written, so the
+        # compressed file never has to be read back
+        algorithm = Config.HASH_ALGORITHM
+        plain_snapshot_path = None
+        if Config.COMPRESS_LOGS:
+            plain_snapshot_path = snapshot_log_path
+            snapshot_log_path, digest = self._compress_snapshot(snapshot_log_path, algorithm)
+        else:
+            digest = self.crypto.calculate_digest(snapshot_log_path, algorithm)
+        if not digest:
             return False
             
         # 2. Save hash to file
-        hash_path = Path(f"{snapshot_log_path}{Config.HASH_FILE_EXTENSION}")
-        if not self.crypto.save_hash(hash_value, hash_path):
+        hash_path = Config.get_hash_path(snapshot_log_path)
+        if not self.crypto.save_hash(digest.hex(), hash_path):
             return False
             
-        # 3. Sign the snapshot log file
-        signature_path = self.crypto.sign_file(snapshot_log_path)
+        # 3. Sign the snapshot digest
+        signature_path = self.crypto.sign_digest(digest, Config.get_signature_path(snapshot_log_path), algorithm)
         if not signature_path:
             return False
             
+        # The signed .zst is now the record; the uncompressed snapshot is unsigned, so remove it
+        if plain_snapshot_path is not None:
+            try:
+                plain_snapshot_path.unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove uncompressed snapshot {plain_snapshot_path}: {e}")
+            
+        # 4. Archive the snapshot, hash, and signature concurrently
+        date_prefix = self.audit_logger.log_date.strftime("%Y/%m/%d/")
+        # Storage (S3 client and upload pool) is only needed here, and is shut down afterwards
+        with StorageProcessor() as storage:
+            if not storage.upload_files([snapshot_log_path, hash_path, signature_path], date_prefix):
+                return False
+            
         # Store the paths for verification
         self.snapshot_log_path = snapshot_log_path
         self.signature_path = signature_path
@@ -344,43 +659,101 @@ class AuditTrailProcessor:
             logger.info("Log processing failed")
         return success
     
-    def verify_logs(self, log_path: Path = None, signature_path: Path = None) -> bool:
-        """Verify the integrity of a log file using its signature.
+    def _compress_snapshot(self, snapshot_log_path: Path, algorithm: str) -> Tuple[Optional[Path], Optional[bytes]]:
+        """Compress a snapshot with zstd into a sibling file, hashing the output as it is written.
         
         Args:
-            log_path: Path to the log file to verify
-            signature_path: Path to the signature file
+            snapshot_log_path: Path to the snapshot to compress
+            algorithm: hashlib algorithm to hash the compressed output with
             
         Returns:
-            True if verification is successful, False otherwise
+            Tuple containing (compressed_path, digest), or (None, None) if error
         """
-        # Use stored paths if not provided
-        if log_path is None and hasattr(self, 'snapshot_log_path'):
-            log_path = self.snapshot_log_path
-        if signature_path is None and hasattr(self, 'signature_path'):
-            signature_path = self.signature_path
+        compressed_path = snapshot_log_path.with_name(snapshot_log_path.name + Config.COMPRESSED_FILE_EXTENSION)
+        try:
+            compressor = zstandard.ZstdCompressor(level=Config.COMPRESSION_LEVEL, threads=-1)
+            file_hash = hashlib.new(algorithm)
+            with open(snapshot_log_path, 'rb') as src, open(compressed_path, 'wb') as dst:
+                for chunk in compressor.read_to_iter(src, read_size=Config.HASH_CHUNK_SIZE):
+                    dst.write(chunk)
+                    file_hash.update(chunk)
+                    
+            logger.info(
+                f"Compressed snapshot to {compressed_path} "
+                f"({snapshot_log_path.stat().st_size} -> {compressed_path.stat().st_size} bytes)"
+            )
+            return compressed_path, file_hash.digest()
+        except Exception as e:
+            logger.error(f"Error compressing snapshot: {e}")
+            return None, None
+    
+    def _resolve_log_paths(self, log_path: Union[str, Path], signature_path: Optional[Union[str, Path]]) -> Tuple[Path, Path]:
+        """Resolve a log path and its signature path for verification.
+        
+        Args:
+            log_path: Path to the log file (bare file names are looked up in the log directory)
+            signature_path: Path to the signature file, or None to use the default location
             
+        Returns:
+            Tuple containing (log_path, signature_path)
+        """
         # Ensure log_path is a Path object
         if isinstance(log_path, str):
             log_path = Path(log_path)
             
-        # Make sure we have the absolute path if log_path doesn't include the directory
-        if not log_path.is_absolute() and str(log_path).count('/') == 0:
-            log_path = Config.LOG_DIR / log_path
+        # A bare file name (no directory component) lives in the log directory
+        if len(log_path.parts) == 1:
+            log_path = Config.LOG_DIR.joinpath(log_path)
             
-        if not log_path.exists():
-            logger.error(f"Log file not found: {log_path}")
-            return False
-            
-        # If signature path not provided, try to find it
+        # If signature path not provided, use the one sign_digest writes next to the log
         if signature_path is None:
-            signature_path = Config.SIGNATURES_DIR / f"{log_path.name}{Config.SIGNATURE_FILE_EXTENSION}"
+            signature_path = Config.get_signature_path(log_path)
+        elif isinstance(signature_path, str):
+            signature_path = Path(signature_path)
             
-        if not signature_path.exists():
-            logger.error(f"Signature file not found: {signature_path}")
-            return False
-                
-        # Verify the file
+        return log_path, signature_path
+    
+    def verify_logs(self, log_path: Union[Path, List[Path]] = None,
+                    signature_path: Union[Path, List[Path]] = None) -> bool:
+        """Verify the integrity of a log file using its signature.
+        
+        Passing a list of log paths (and optionally a matching list of
+        signature paths) verifies them all in parallel with verify_many.
+        
+        Args:
+            log_path: Path to the log file to verify, or a list of paths
+            signature_path: Path to the signature file, or a list matching log_path
+            
+        Returns:
+            True if verification is successful (for every log, given a list), False otherwise
+        """
+        if isinstance(log_path, list):
+            if not log_path:
+                logger.error("No log files given to verify")
+                return False
+            signature_paths = signature_path or [None] * len(log_path)
+            if len(signature_paths) != len(log_path):
+                logger.error(f"Got {len(log_path)} log files but {len(signature_paths)} signature files")
+                return False
+            pairs = [self._resolve_log_paths(l, s) for l, s in zip(log_path, signature_paths)]
+            results = self.crypto.verify_many(pairs)
+            
+            failed = [pair[0].name for pair, ok in zip(pairs, results) if not ok]
+            if failed:
+                logger.error(f"Verification failed for {len(failed)} of {len(pairs)} log files: {', '.join(failed)}")
+            else:
+                logger.info(f"Verification successful for all {len(pairs)} log files")
+            return not failed
+            
+        # Use stored paths if not provided
+        if log_path is None and hasattr(self, 'snapshot_log_path'):
+            log_path = self.snapshot_log_path
+        if signature_path is None and hasattr(self, 'signature_path'):
+            signature_path = self.signature_path
+            
+        log_path, signature_path = self._resolve_log_paths(log_path, signature_path)
+        
+        # Verify the file (verify_file reports missing log or signature files)
         result = self.crypto.verify_file(log_path, signature_path)
         
         if result:
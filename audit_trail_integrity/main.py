@@ -8,12 +8,14 @@ while also incorporating integrity checks.
 
 import os
 import sys
-import glob
+import shutil
 import logging
 import argparse
 import datetime
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Any, Tuple
 
 # Import modules from the audit trail integrity system
 from config import Config
@@ -28,6 +30,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger('audit_trail')
 
+# Compliance metrics that do not depend on configuration are computed once at import
+_COMPLIANCE_METRICS = MappingProxyType({
+    # All logs are signed in our implementation
+    "log_signing_percentage": 100,
+    "immutable_storage": "AWS S3 Glacier with Vault Lock",
+    "immutable_storage_check": "True",  # Simulated for demonstration
+    "integrity_verification_frequency": "Daily",
+    "integrity_verification_check": "Matches Policy",  # Assuming daily checks match policy
+    "access_control_count": 2  # Simulated for demonstration (e.g., Admin and Audit roles)
+})
+
 
 def setup_argparse() -> argparse.ArgumentParser:
     """Set up command line argument parsing.
@@ -78,26 +91,16 @@ def clean_directories():
     """Clean up logs, signatures, and keys directories."""
     logger.info("Cleaning up previous logs, signatures, and keys...")
     
-    # Remove logs directory contents
-    for file_path in glob.glob(f"{Config.LOG_DIR}/*"):
-        try:
-            os.remove(file_path)
-        except Exception as e:
-            logger.warning(f"Failed to remove {file_path}: {e}")
-    
-    # Remove signatures directory contents
-    for file_path in glob.glob(f"{Config.SIGNATURES_DIR}/*"):
-        try:
-            os.remove(file_path)
-        except Exception as e:
-            logger.warning(f"Failed to remove {file_path}: {e}")
-    
-    # Remove keys directory contents
-    for file_path in glob.glob(f"{Config.KEYS_DIR}/*"):
-        try:
-            os.remove(file_path)
-        except Exception as e:
-            logger.warning(f"Failed to remove {file_path}: {e}")
+    for directory in (Config.LOG_DIR, Config.SIGNATURES_DIR, Config.KEYS_DIR):
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except OSError as e:
+                    logger.warning(f"Failed to remove {entry.path}: {e}")
 
 
 def generate_keys() -> bool:
@@ -167,60 +170,45 @@ def run_demo(count: int = 10, clean: bool = False) -> bool:
     print("-" * 80)
     print(f"Log Signing: {compliance_metrics['log_signing_percentage']}% of designated critical log types are cryptographically signed (Target: 100%)")
     print(f"Signing Algorithm: {compliance_metrics['signing_algorithm']} - {compliance_metrics['signing_algorithm_check']}")
+    fips_note = "FIPS-approved digest" if compliance_metrics['hash_algorithm_check'] == "Pass" else "not a FIPS-approved digest"
+    print(f"Hash Algorithm: {compliance_metrics['hash_algorithm']} - {compliance_metrics['hash_algorithm_check']} ({fips_note})")
     print(f"Immutable Storage: {compliance_metrics['immutable_storage']} (Configuration Check: {compliance_metrics['immutable_storage_check']})")
     print(f"Integrity Verification: {compliance_metrics['integrity_verification_frequency']} (Check: {compliance_metrics['integrity_verification_check']})")
     print(f"Access Control: {compliance_metrics['access_control_count']} entities with write/delete access (Target: ≤ 2 roles/principals)")
     print("=" * 80)
     
-    # Clean up snapshot files
-    for snapshot_file in glob.glob(f"{Config.LOG_DIR}/*.snapshot*"):
-        try:
-            Path(snapshot_file).unlink()
-            logger.debug(f"Removed temporary file: {snapshot_file}")
-        except Exception as e:
-            logger.warning(f"Failed to remove temporary file {snapshot_file}: {e}")
-    
     logger.info("Audit trail processing complete")
     return verify_result
 
 
-def generate_compliance_metrics(processor: Any) -> Dict[str, Any]:
+def generate_compliance_metrics(processor: Any) -> Mapping[str, Any]:
     """Generate compliance metrics for the audit trail system.
     
+    None of the metrics depend on the processor; the algorithm metrics are
+    merged into the shared static ones once per algorithm configuration, so
+    runtime changes to Config are reflected without rebuilding on every call.
+    
     Args:
         processor: The AuditTrailProcessor instance
         
     Returns:
-        Dictionary containing compliance metrics
+        Read-only mapping containing compliance metrics
     """
-    # Check log signing percentage
-    log_signing_percentage = 100  # All logs are signed in our implementation
-    
-    # Check signing algorithm
-    signing_algorithm = "SHA-256"
-    signing_algorithm_check = "Pass" if signing_algorithm in ["SHA-256", "SHA-384", "SHA-512"] else "Fail"
-    
-    # Check immutable storage
-    immutable_storage = "AWS S3 Glacier with Vault Lock"
-    immutable_storage_check = "True"  # Simulated for demonstration
-    
-    # Check integrity verification frequency
-    integrity_verification_frequency = "Daily"
-    integrity_verification_check = "Matches Policy"  # Assuming daily checks match policy
-    
-    # Check access control
-    access_control_count = 2  # Simulated for demonstration (e.g., Admin and Audit roles)
-    
-    return {
-        "log_signing_percentage": log_signing_percentage,
-        "signing_algorithm": signing_algorithm,
-        "signing_algorithm_check": signing_algorithm_check,
-        "immutable_storage": immutable_storage,
-        "immutable_storage_check": immutable_storage_check,
-        "integrity_verification_frequency": integrity_verification_frequency,
-        "integrity_verification_check": integrity_verification_check,
-        "access_control_count": access_control_count
-    }
+    return _compliance_metrics_for(Config.SIGNATURE_ALGORITHM, Config.HASH_ALGORITHM)
+
+
+@functools.lru_cache(maxsize=None)
+def _compliance_metrics_for(signature_algorithm: str, hash_algorithm: str) -> Mapping[str, Any]:
+    """Merge the algorithm-dependent metrics into the static compliance metrics."""
+    return MappingProxyType({
+        **_COMPLIANCE_METRICS,
+        # Signatures are made over a Config.HASH_ALGORITHM digest of each log
+        "signing_algorithm": f"{signature_algorithm} over {hash_algorithm}",
+        "signing_algorithm_check": "Pass" if signature_algorithm in ["Ed25519", "ECDSA", "RSA"] else "Fail",
+        "hash_algorithm": hash_algorithm,
+        # Only FIPS-approved digests pass; opting into BLAKE2 is reported as a failure
+        "hash_algorithm_check": "Pass" if hash_algorithm in ["sha256", "sha384", "sha512", "sha3_256", "sha3_384", "sha3_512"] else "Fail",
+    })
 
 
 def main():
@@ -246,13 +234,13 @@ def main():
         processor = AuditTrailProcessor()
         if args.log_file:
             log_path = Path(args.log_file)
-            signature_path = Path(f"{args.log_file}{Config.SIGNATURE_FILE_EXTENSION}")
+            signature_path = Config.get_signature_path(log_path)
             result = processor.verify_logs(log_path, signature_path)
         else:
             # Verify today's log
             today = datetime.date.today()
             log_path = Config.get_log_path_for_date(today)
-            signature_path = Path(f"{log_path}{Config.SIGNATURE_FILE_EXTENSION}")
+            signature_path = Config.get_signature_path(log_path)
             result = processor.verify_logs(log_path, signature_path)
         sys.exit(0 if result else 1)
     
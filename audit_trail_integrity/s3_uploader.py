@@ -5,26 +5,32 @@ AWS S3 upload functionality for the audit trail integrity system.
 This module handles the secure upload of log files, hash files, and signatures to AWS S3.
 """
 
+import re
 import logging
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 from config import Config
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format=Config.LOG_FORMAT
-)
+# Logging output is configured once, by the entry point (main.py)
 logger = logging.getLogger('audit_trail')
 
 class StorageProcessor:
     """Handles storage operations for audit logs and signatures."""
     
+    # One client (and its connection pool) is shared by all instances
+    _shared_client = None
+    
+    # Archived keys look like <S3_PREFIX>/YYYY/MM/DD/<filename>
+    _KEY_DATE_RE = re.compile(rf"^{re.escape(Config.S3_PREFIX)}/(\d{{4}})/(\d{{2}})/(\d{{2}})/")
+    
     def __init__(self, simulate: bool = True):
         """Initialize the storage processor.
         
@@ -33,11 +39,40 @@ class StorageProcessor:
         """
         self.simulate = simulate
         self.s3_client = self._get_s3_client()
+        self.transfer_config = TransferConfig(
+            multipart_threshold=Config.S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=Config.S3_MULTIPART_CHUNKSIZE,
+            max_concurrency=Config.S3_MAX_CONCURRENCY,
+            use_threads=True
+        )
+        # Long-lived pool for concurrent uploads; threads are started on demand
+        self._pool = ThreadPoolExecutor(max_workers=Config.S3_UPLOAD_WORKERS)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the upload thread pool, waiting for pending uploads."""
+        self._pool.shutdown(wait=True)
     
     def _get_s3_client(self):
-        """Get an S3 client."""
+        """Get the shared S3 client, creating it on first use."""
+        if StorageProcessor._shared_client is not None:
+            return StorageProcessor._shared_client
+            
         try:
-            return boto3.client('s3')
+            StorageProcessor._shared_client = boto3.client(
+                's3',
+                config=BotoConfig(
+                    retries={'max_attempts': Config.S3_MAX_ATTEMPTS, 'mode': 'adaptive'},
+                    max_pool_connections=Config.S3_MAX_POOL_CONNECTIONS,
+                    tcp_keepalive=True
+                )
+            )
+            return StorageProcessor._shared_client
         except Exception as e:
             logger.error(f"Error creating S3 client: {e}")
             return None
@@ -63,8 +98,8 @@ class StorageProcessor:
         s3_key = f"{Config.S3_PREFIX}/{date_prefix}{file_path.name}"
         
         if self.simulate:
-            logger.info(f"SIMULATION: Would upload {file_path} to s3://{Config.S3_BUCKET_NAME}/{s3_key}")
-            logger.info(f"SIMULATION: Using storage class: {Config.S3_STORAGE_CLASS}")
+            logger.info("SIMULATION: Would upload %s to s3://%s/%s", file_path, Config.S3_BUCKET_NAME, s3_key)
+            logger.info("SIMULATION: Using storage class: %s", Config.S3_STORAGE_CLASS)
             return True
             
         try:
@@ -75,15 +110,29 @@ class StorageProcessor:
                 s3_key,
                 ExtraArgs={
                     'StorageClass': Config.S3_STORAGE_CLASS
-                }
+                },
+                Config=self.transfer_config
             )
             
-            logger.info(f"Uploaded {file_path} to s3://{Config.S3_BUCKET_NAME}/{s3_key}")
+            logger.info("Uploaded %s to s3://%s/%s", file_path, Config.S3_BUCKET_NAME, s3_key)
             return True
         except ClientError as e:
             logger.error(f"Error uploading to S3: {e}")
             return False
     
+    def upload_files(self, file_paths: List[Union[str, Path]], date_prefix: str = "") -> bool:
+        """Upload several files to S3 concurrently.
+        
+        Args:
+            file_paths: Paths to the files to upload (e.g. log, hash and signature)
+            date_prefix: Optional date prefix for the S3 keys
+            
+        Returns:
+            True if every upload succeeded or was simulated, False otherwise
+        """
+        futures = [self._pool.submit(self.upload_to_s3, path, date_prefix) for path in file_paths]
+        return all([future.result() for future in futures])
+    
     def download_from_s3(self, s3_key: str, local_path: Union[str, Path]) -> bool:
         """Download a file from S3.
         
@@ -109,7 +158,8 @@ class StorageProcessor:
             self.s3_client.download_file(
                 Config.S3_BUCKET_NAME,
                 s3_key,
-                str(local_path)
+                str(local_path),
+                Config=self.transfer_config
             )
             
             logger.info(f"Downloaded s3://{Config.S3_BUCKET_NAME}/{s3_key} to {local_path}")
@@ -133,32 +183,27 @@ class StorageProcessor:
             return []
             
         try:
-            # Construct the prefix for the date range
+            # Narrow the prefix to the year (and month) shared by the whole range,
+            # so S3 filters server-side instead of listing every archived log
             prefix = f"{Config.S3_PREFIX}/"
+            if start_date.year == end_date.year:
+                prefix += f"{start_date.year:04d}/"
+                if start_date.month == end_date.month:
+                    prefix += f"{start_date.month:02d}/"
             
-            # List objects in the S3 bucket with the specified prefix
-            response = self.s3_client.list_objects_v2(
-                Bucket=Config.S3_BUCKET_NAME,
-                Prefix=prefix
-            )
+            # List every page of objects under the prefix (one call returns at most 1000 keys)
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            pages = paginator.paginate(Bucket=Config.S3_BUCKET_NAME, Prefix=prefix)
             
-            # Filter objects by date
+            # Filter objects by date, comparing (year, month, day) tuples parsed by one regex match
+            start_key = (start_date.year, start_date.month, start_date.day)
+            end_key = (end_date.year, end_date.month, end_date.day)
             matching_keys = []
-            for obj in response.get('Contents', []):
+            for obj in (obj for page in pages for obj in page.get('Contents', [])):
                 key = obj['Key']
-                # Extract the date from the key (assuming format YYYY/MM/DD/filename)
-                key_parts = key.split('/')
-                if len(key_parts) >= 4:
-                    try:
-                        year = int(key_parts[1])
-                        month = int(key_parts[2])
-                        day = int(key_parts[3])
-                        log_date = datetime.date(year, month, day)
-                        
-                        if start_date <= log_date <= end_date:
-                            matching_keys.append(key)
-                    except (ValueError, IndexError):
-                        continue
+                match = self._KEY_DATE_RE.match(key)
+                if match and start_key <= (int(match[1]), int(match[2]), int(match[3])) <= end_key:
+                    matching_keys.append(key)
             
             return matching_keys
         except ClientError as e:
@@ -1,16 +1,26 @@
 # Example of the 'Data Clumps' code smell
 # Martin Fowler Refactoring Catalog
 
-def print_personal_info(first_name, last_name, phone, email):
-    print(f"Name: {first_name} {last_name}")
-    print(f"Phone: {phone}")
-    print(f"Email: {email}")
+from typing import NamedTuple
 
-def save_personal_info(first_name, last_name, phone, email):
+class PersonalInfo(NamedTuple):
+    # Parameter object for the fields that always travel together
+    first_name: str
+    last_name: str
+    phone: str
+    email: str
+
+def print_personal_info(info: PersonalInfo):
+    print(f"Name: {info.first_name} {info.last_name}")
+    print(f"Phone: {info.phone}")
+    print(f"Email: {info.email}")
+
+def save_personal_info(info: PersonalInfo):
     # Simulate saving info
-    print(f"Saving: {first_name} {last_name}, {phone}, {email}")
+    print(f"Saving: {info.first_name} {info.last_name}, {info.phone}, {info.email}")
 
 # Usage example (for demonstration only):
 if __name__ == "__main__":
-    print_personal_info('Jane', 'Smith', '555-1234', 'jane@example.com')
-    save_personal_info('Jane', 'Smith', '555-1234', 'jane@example.com')
+    info = PersonalInfo('Jane', 'Smith', '555-1234', 'jane@example.com')
+    print_personal_info(info)
+    save_personal_info(info)
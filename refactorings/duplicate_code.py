@@ -1,17 +1,17 @@
 # Example of the 'Duplicate Code' code smell
 # Martin Fowler Refactoring Catalog
 
-def calculate_area_rectangle(width, height):
-    # Duplicate logic for area calculation
-    if width <= 0 or height <= 0:
+def _area(coeff, a, b):
+    # Shared validation and formula for every area calculation
+    if min(a, b) <= 0:
         raise ValueError('Invalid dimensions')
-    return width * height
+    return coeff * a * b
+
+def calculate_area_rectangle(width, height):
+    return _area(1, width, height)
 
 def calculate_area_triangle(base, height):
-    # Duplicate validation logic
-    if base <= 0 or height <= 0:
-        raise ValueError('Invalid dimensions')
-    return 0.5 * base * height
+    return _area(0.5, base, height)
 
 # Usage example (for demonstration only):
 if __name__ == "__main__":
@@ -2,20 +2,45 @@
 # Martin Fowler Refactoring Catalog
 
 class Address:
+    __slots__ = ('street', 'city', 'zip_code')
+
     def __init__(self, street, city, zip_code):
-        self.street = street
-        self.city = city
-        self.zip_code = zip_code
+        # Addresses are immutable; fields are set once here
+        object.__setattr__(self, 'street', street)
+        object.__setattr__(self, 'city', city)
+        object.__setattr__(self, 'zip_code', zip_code)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Address is immutable; cannot set {name!r}")
+
+    def __reduce__(self):
+        # Rebuild through __init__ so copy and pickle don't go through __setattr__
+        return (Address, (self.street, self.city, self.zip_code))
 
 class Customer:
+    __slots__ = ('name', '_address', '_full_address')
+
     def __init__(self, name, address):
         self.name = name
         self.address = address
 
+    @property
+    def address(self):
+        return self._address
+
+    @address.setter
+    def address(self, address):
+        # A new address invalidates the cached display string
+        self._address = address
+        self._full_address = None
+
     def display_full_address(self):
         # This method is more interested in Address fields than Customer fields
-        addr = self.address
-        return f"{addr.street}, {addr.city}, {addr.zip_code}"
+        # Address is immutable, so the string only needs formatting once per address
+        if self._full_address is None:
+            addr = self.address
+            self._full_address = ', '.join(map(str, (addr.street, addr.city, addr.zip_code)))
+        return self._full_address
 
 # Usage example (for demonstration only):
 if __name__ == "__main__":
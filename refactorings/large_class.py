@@ -1,16 +1,23 @@
 # Example of the 'Large Class' code smell
 # Martin Fowler Refactoring Catalog
 
+import sys
+from collections import defaultdict
+
 class EmployeeManager:
+    __slots__ = ('employees', 'departments', 'salaries', 'benefits',
+                 'performance_reviews', 'attendance_records', 'training_records',
+                 'expense_reports', 'hiring_requests', 'termination_requests')
+
     def __init__(self):
         self.employees = []
         self.departments = {}
         self.salaries = {}
-        self.benefits = {}
-        self.performance_reviews = {}
-        self.attendance_records = {}
-        self.training_records = {}
-        self.expense_reports = {}
+        self.benefits = defaultdict(list)
+        self.performance_reviews = defaultdict(list)
+        self.attendance_records = defaultdict(list)
+        self.training_records = defaultdict(list)
+        self.expense_reports = defaultdict(list)
         self.hiring_requests = {}
         self.termination_requests = {}
 
@@ -18,25 +25,26 @@ class EmployeeManager:
         self.employees.append(employee)
 
     def assign_department(self, employee_id, department):
-        self.departments[employee_id] = department
+        # Departments repeat across employees; share one string object per name
+        self.departments[employee_id] = sys.intern(department) if type(department) is str else department
 
     def set_salary(self, employee_id, salary):
         self.salaries[employee_id] = salary
 
     def add_benefit(self, employee_id, benefit):
-        self.benefits.setdefault(employee_id, []).append(benefit)
+        self.benefits[employee_id].append(benefit)
 
     def record_performance_review(self, employee_id, review):
-        self.performance_reviews.setdefault(employee_id, []).append(review)
+        self.performance_reviews[employee_id].append(review)
 
     def record_attendance(self, employee_id, date):
-        self.attendance_records.setdefault(employee_id, []).append(date)
+        self.attendance_records[employee_id].append(date)
 
     def add_training(self, employee_id, training):
-        self.training_records.setdefault(employee_id, []).append(training)
+        self.training_records[employee_id].append(training)
 
     def submit_expense_report(self, employee_id, report):
-        self.expense_reports.setdefault(employee_id, []).append(report)
+        self.expense_reports[employee_id].append(report)
 
     def request_hiring(self, position):
         self.hiring_requests[position] = 'pending'
@@ -1,26 +1,41 @@
 # Example of the 'Long Method' code smell
 # Martin Fowler Refactoring Catalog
 
-def process_customer_order(order):
+from math import fsum
+from operator import itemgetter
+from typing import Any, Dict
+
+TAX_RATE = 0.07
+HIGH_VALUE_THRESHOLD = 1000
+_TOTALS_FMT = "Subtotal: ${:.2f}\nTax: ${:.2f}\nTotal: ${:.2f}"
+_price_and_quantity = itemgetter('price', 'quantity')
+
+def _line_totals(items):
+    # Validates each item's quantity as its line total is produced
+    for item in items:
+        price, quantity = _price_and_quantity(item)
+        if quantity <= 0:
+            raise ValueError(f"Invalid quantity for item {item['id']}")
+        yield price * quantity
+
+def process_customer_order(order: Dict[str, Any]) -> None:
     # This method does too much: validation, calculation, and notification
-    if not order.get('customer_id'):
+    try:
+        customer_id = order['customer_id']
+        items = order['items']
+    except KeyError as e:
+        raise ValueError('Missing customer ID' if e.args[0] == 'customer_id' else 'No items in order') from None
+    if not customer_id:
         raise ValueError('Missing customer ID')
-    if not order.get('items'):
+    if not items:
         raise ValueError('No items in order')
-    for item in order['items']:
-        if item['quantity'] <= 0:
-            raise ValueError(f"Invalid quantity for item {item['id']}")
-    subtotal = 0
-    for item in order['items']:
-        subtotal += item['price'] * item['quantity']
-    tax = subtotal * 0.07
-    total = subtotal + tax
-    print(f"Subtotal: ${subtotal:.2f}")
-    print(f"Tax: ${tax:.2f}")
-    print(f"Total: ${total:.2f}")
-    if total > 1000:
-        print("High value order! Notifying sales team...")
-    print(f"Order for customer {order['customer_id']} processed successfully.")
+    subtotal: float = fsum(_line_totals(items))
+    tax: float = subtotal * TAX_RATE
+    total: float = subtotal + tax
+    summary = _TOTALS_FMT.format(subtotal, tax, total)
+    if total > HIGH_VALUE_THRESHOLD:
+        summary += "\nHigh value order! Notifying sales team..."
+    print(f"{summary}\nOrder for customer {customer_id} processed successfully.")
 
 # Usage example (for demonstration only):
 if __name__ == "__main__":